@@ -10,6 +10,7 @@ import platform
 
 
 DEFAULT_OUTPUT_DIR = Path("./docs/docs/")
+GITIGNORE_CONTENT = b"**\n"
 # Templates
 FAVICON_URL = "https://ariel.ninja/mousefox/icon.png"
 TEMPLATE_DIR = Path("./docs/templates")
@@ -21,6 +22,10 @@ PGNET_PATH = Path("../pgnet/pgnet")
 MOUSEFOX_GITTREE = "https://github.com/ArielHorwitz/mousefox/blob/master/mousefox/"
 KVEX_GITTREE = "https://github.com/ArielHorwitz/kvex/blob/master/kvex/"
 PGNET_GITTREE = "https://github.com/ArielHorwitz/pgnet/blob/master/pgnet/"
+# Images to copy into the docs
+DOCS_IMAGES = ("icon.png", "banner.png")
+# Platform name, used to pick how to open files
+_SYSTEM = platform.system()
 
 
 def make_docs(
@@ -30,6 +35,7 @@ def make_docs(
     mousefox_path: Path = MOUSEFOX_PATH,
     kvex_path: Path = KVEX_PATH,
     pgnet_path: Path = PGNET_PATH,
+    use_subprocess: bool = False,
 ):
     """Make documentation.
 
@@ -42,13 +48,75 @@ def make_docs(
         auto_open: Automatically open docs in browser.
         mousefox_path: Path to mousefox project folder.
         kvex_path: Path to kvex project folder.
-        pgnet_path: Path to pgnet project folder.,
+        pgnet_path: Path to pgnet project folder.
+        use_subprocess: Run pdoc as a subprocess instead of in-process. Always used
+            when running the docs server.
     """
+    modules = [str(mousefox_path), str(kvex_path), str(pgnet_path)]
+    if output_dir:
+        # Clear the existing folder's contents if requested, keeping .gitignore
+        if delete_existing and output_dir.is_dir():
+            _clear_dir(output_dir, keep=(".gitignore",))
+        # Create folder if missing
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # Add a gitignore file to ignore entire docs folder
+        gitignore = output_dir / ".gitignore"
+        if not gitignore.is_file() or gitignore.read_bytes() != GITIGNORE_CONTENT:
+            gitignore.write_bytes(GITIGNORE_CONTENT)
+    if output_dir and not use_subprocess:
+        _run_pdoc(modules, output_dir)
+    else:
+        _run_pdoc_subprocess(modules, output_dir, auto_open)
+    if output_dir:
+        # Copy images (copyfile uses the platform's zero-copy path, skipping metadata)
+        for image in DOCS_IMAGES:
+            shutil.copyfile(mousefox_path / image, output_dir / image)
+    if output_dir and auto_open:
+        _popen_path(output_dir / "index.html")
+
+
+def _clear_dir(path: Path, keep: tuple[str, ...] = ()):
+    """Delete the contents of directory *path*, except for top-level names in *keep*."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name in keep:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def _run_pdoc(modules: list[str], output_dir: Path):
+    """Run pdoc in-process, writing the docs to *output_dir*."""
+    # Kivy parses sys.argv on import, which would pick up our own flags
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    import pdoc
+    import pdoc.render
+
+    print(f"Running pdoc on {modules} to {str(output_dir)!r}")
+    pdoc.render.configure(
+        favicon=FAVICON_URL,
+        docformat="google",
+        template_directory=TEMPLATE_DIR,
+        edit_url_map={
+            "mousefox": MOUSEFOX_GITTREE,
+            "kvex": KVEX_GITTREE,
+            "pgnet": PGNET_GITTREE,
+        },
+    )
+    pdoc.pdoc(*modules, output_directory=output_dir)
+
+
+def _run_pdoc_subprocess(
+    modules: list[str],
+    output_dir: Optional[Path],
+    auto_open: bool,
+):
+    """Run pdoc as a subprocess. If *output_dir* is None, will run the docs server."""
     command = "pdoc"
     args = [
-        str(mousefox_path),
-        str(kvex_path),
-        str(pgnet_path),
+        *modules,
         "--favicon",
         FAVICON_URL,
         "--docformat",
@@ -64,32 +132,19 @@ def make_docs(
     ]
     if output_dir:
         args.extend(["-o", str(output_dir)])
-        # Delete existing folder if requested
-        if delete_existing and output_dir.is_dir():
-            shutil.rmtree(output_dir)
-        # Create folder if missing
-        output_dir.mkdir(parents=True, exist_ok=True)
-        # Add a gitignore file to ignore entire docs folder
-        with open(output_dir / ".gitignore", "w") as f:
-            f.write("**\n")
     if not auto_open:
         args.append("-n")
     print(f"Running subprocess {command!r} with arguments:")
     for a in args:
         print(f"  {a}")
     subprocess.run([command, *args])
-    # Copy images
-    shutil.copy2(mousefox_path / "icon.png", output_dir / "icon.png")
-    shutil.copy2(mousefox_path / "banner.png", output_dir / "banner.png")
-    if output_dir and auto_open:
-        _popen_path(output_dir / "index.html")
 
 
 def _popen_path(path):
     """Opens the given path. Method used is platform-dependent."""
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         os.startfile(path)
-    elif platform.system() == "Darwin":
+    elif _SYSTEM == "Darwin":
         subprocess.Popen(["open", path])
     else:
         subprocess.Popen(["xdg-open", path])
@@ -102,13 +157,16 @@ def main():
         * `-a` will pass True to `auto_open`
         * `-d` will pass True to `delete_existing`
         * `-s` will run server instead of saving to disk
+        * `--subprocess` will pass True to `use_subprocess`
     """
     print(f"{sys.argv=}")
+    flags = set(sys.argv[1:])
     kwargs = dict(
-        auto_open="-a" in sys.argv,
-        delete_existing="-d" in sys.argv,
+        auto_open="-a" in flags,
+        delete_existing="-d" in flags,
+        use_subprocess="--subprocess" in flags,
     )
-    if "-s" in sys.argv:
+    if "-s" in flags:
         kwargs["output_dir"] = None
     make_docs(**kwargs)
 
@@ -15,6 +15,14 @@ _STATUS_COLORS = {
     pgnet.Status.BAD.value: kx.XColor.from_hex("ff0000"),
 }
 
+_RESPONSE_LABEL_KWARGS = dict(
+    font_name="RobotoMono-Regular",
+    padding=(10, 10),
+    halign="left",
+    valign="top",
+    fixed_width=True,
+)
+
 
 class AdminFrame(kx.XFrame):
     """Widget for admin controls."""
@@ -70,21 +78,9 @@ class AdminFrame(kx.XFrame):
         self.custom_packet_frame = kx.XDBox()
         self.custom_packet_frame.add_widgets(custom_input_title, self.packet_input)
         # Response labels
-        self.response_label = kx.XLabel(
-            font_name="RobotoMono-Regular",
-            padding=(10, 10),
-            halign="left",
-            valign="top",
-            fixed_width=True,
-        )
+        self.response_label = kx.XLabel(**_RESPONSE_LABEL_KWARGS)
         response_label_frame = kx.XScroll(view=self.response_label)
-        self.debug_label = kx.XLabel(
-            font_name="RobotoMono-Regular",
-            padding=(10, 10),
-            halign="left",
-            valign="top",
-            fixed_width=True,
-        )
+        self.debug_label = kx.XLabel(**_RESPONSE_LABEL_KWARGS)
         debug_label_frame = kx.fwrap(kx.XScroll(view=self.debug_label))
         debug_label_frame.set_size(x="300dp")
         # Assemble
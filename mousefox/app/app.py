@@ -214,9 +214,7 @@ class App(kx.XApp):
         self.menu.add_theme_selectors(prefix="")
 
     def _register_controller(self, controller: kx.XHotkeyController):
-        loaded_dict = util.toml_load(HOTKEYS_FILE)
-        hotkeys = _flatten_hotkey_paths(loaded_dict)
-        for control, hotkeys in hotkeys.items():
+        for control, hotkeys in _FLATTENED_HOTKEYS.items():
             if not isinstance(hotkeys, list):
                 hotkeys = [hotkeys]
             for hk in hotkeys:
@@ -239,14 +237,22 @@ class App(kx.XApp):
 
 def _flatten_hotkey_paths(nested: dict, prefix: str = "") -> dict:
     new_dict = dict()
-    for k, v in nested.items():
-        if isinstance(v, dict):
-            new_dict |= _flatten_hotkey_paths(v, f"{prefix}{k}.")
+    stack = [(prefix, iter(nested.items()))]
+    while stack:
+        path, items = stack[-1]
+        for k, v in items:
+            if isinstance(v, dict):
+                stack.append((f"{path}{k}.", iter(v.items())))
+                break
+            new_dict[f"{path}{k}"] = v
         else:
-            new_dict[f"{prefix}{k}"] = v
+            stack.pop()
     return new_dict
 
 
+_FLATTENED_HOTKEYS = _flatten_hotkey_paths(util.toml_load(HOTKEYS_FILE))
+
+
 async def _close_remaining_tasks(debug: bool = True):
     remaining_tasks = asyncio.all_tasks() - {asyncio.current_task(), }
     if not remaining_tasks:
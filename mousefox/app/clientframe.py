@@ -1,6 +1,7 @@
 """Home of `ClientFrame`."""
 
 from typing import Optional
+from loguru import logger
 import asyncio
 import functools
 import kvex as kx
@@ -68,21 +69,26 @@ class ClientFrame(kx.XAnchor):
 
     def _set_client(self, client: pgnet.Client, /):
         """Set a client for the app to use."""
+        if self._client:
+            logger.warning(f"Ignoring {client=}, already using {self._client=}")
+            return
+        self._client = client
         asyncio.create_task(self._async_set_client(client))
 
     async def _async_set_client(self, client: pgnet.Client, /):
-        assert not self._client
-        self._client = client
-        self.app.set_feedback(client.status)
-        user_frame = UserFrame(client, self._game_widget_factory)
-        self._user_container.content = user_frame
-        client.on_status = functools.partial(self._on_client_status, client)
-        client.on_connection = functools.partial(self._on_client_connected, client)
-        await client.async_connect()
-        assert not client.connected
-        self._user_container.content = None
-        self._client = None
-        self._sm.current = "connect"
+        assert client is self._client
+        try:
+            self.app.set_feedback(client.status)
+            user_frame = UserFrame(client, self._game_widget_factory)
+            self._user_container.content = user_frame
+            client.on_status = functools.partial(self._on_client_status, client)
+            client.on_connection = functools.partial(self._on_client_connected, client)
+            await client.async_connect()
+            assert not client.connected
+        finally:
+            self._user_container.content = None
+            self._client = None
+            self._sm.current = "connect"
 
     def _on_client_connected(self, client: pgnet.Client, connected: bool):
         assert client is self._client
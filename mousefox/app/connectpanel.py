@@ -1,7 +1,7 @@
 """Home of `ConnectPanel`."""
 
-from typing import Callable
-from dataclasses import dataclass
+from typing import Callable, ClassVar, Optional
+from dataclasses import dataclass, asdict, replace
 from loguru import logger
 import json
 import kvex as kx
@@ -20,23 +20,32 @@ class _ConnectionConfig:
     address: str = "localhost"
     port: int = pgnet.util.DEFAULT_PORT
     pubkey: str = ""
+    _cached: ClassVar[Optional["_ConnectionConfig"]] = None
 
     @classmethod
     def load_from_disk(cls) -> "_ConnectionConfig":
-        if not CONFIG_FILE.is_file():
+        if cls._cached is None:
+            cls._cached = cls._read_from_disk()
+        if cls._cached is None:
             return cls()
-        with open(CONFIG_FILE) as f:
-            try:
-                config = json.load(f)
-            except json.decoder.JSONDecodeError as e:
-                logger.warning(f"Failed to load connection config: {e}")
-                return cls()
-        return cls(**config)
+        return replace(cls._cached)
+
+    @classmethod
+    def _read_from_disk(cls) -> Optional["_ConnectionConfig"]:
+        if not CONFIG_FILE.is_file():
+            return None
+        try:
+            return cls(**json.loads(util.file_load(CONFIG_FILE)))
+        except (json.decoder.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Failed to load connection config: {e}")
+            return None
 
     def save_to_disk(self):
-        data = {k: getattr(self, k) for k in self.__dataclass_fields__.keys()}
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(data, f, indent=4)
+        if self == self._cached and CONFIG_FILE.is_file():
+            return
+        data = asdict(self)
+        util.file_dump(CONFIG_FILE, json.dumps(data, indent=4))
+        type(self)._cached = replace(self)
 
 
 class ConnectPanel(kx.XAnchor):
@@ -64,29 +73,15 @@ class ConnectPanel(kx.XAnchor):
         self.app.controller.bind(f"{self._conpath}.focus", self.set_focus)
 
     def _make_widgets(self, info_text, online_info_text):
-        self.clear_widgets()
         config = _ConnectionConfig.load_from_disk()
         if not self._enable_remote and config.online:
             config.online = False
         elif not self._enable_local and not config.online:
             config.online = True
         # Side panel
-        info_label = kx.XLabel(
-            text=info_text,
-            valign="top",
-            halign="left",
-            padding=(10, 10),
-            fixed_width=True,
-        )
-        online_info_label = kx.XLabel(
-            text=online_info_text,
-            valign="top",
-            halign="left",
-            padding=(10, 10),
-            fixed_width=True,
-        )
+        info_label = _make_info_label(info_text)
         self._online_info_label = kx.XCurtain(
-            content=online_info_label,
+            content=_make_info_label(online_info_text),
             showing=config.online,
         )
         left_labels = kx.XDBox()
@@ -155,7 +150,6 @@ class ConnectPanel(kx.XAnchor):
         get_value = self.connection_panel.get_value
         online = get_value("online")
         advanced = online and get_value("advanced")
-        online = get_value("online")
         username = get_value("username")
         password = get_value("password")
         invite_code = get_value("invite_code")
@@ -194,3 +188,13 @@ class ConnectPanel(kx.XAnchor):
     def set_focus(self, *args):
         """Focus the input widgets."""
         self.connection_panel.set_focus("username")
+
+
+def _make_info_label(text: str) -> kx.XLabel:
+    return kx.XLabel(
+        text=text,
+        valign="top",
+        halign="left",
+        padding=(10, 10),
+        fixed_width=True,
+    )
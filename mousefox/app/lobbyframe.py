@@ -1,13 +1,26 @@
 """Home of `LobbyFrame`."""
 
 from typing import Optional
-import arrow
+import functools
+import time
 import kvex as kx
 import pgnet
 
 
 LINE_WIDGET_HEIGHT = 40
 AUTO_REFRESH_INTERVAL = 1
+REFRESH_TIMEOUT = AUTO_REFRESH_INTERVAL * 5
+GAME_INFO_TEMPLATE = (
+    "[b]{name}[/b]"
+    "\n\n"
+    "{users} users in game."
+    "\n\n"
+    "{password}"
+    "\n\n"
+    "[u]Game info[/u]"
+    "\n\n"
+    "{info}"
+)
 
 
 class LobbyFrame(kx.XAnchor):
@@ -19,8 +32,10 @@ class LobbyFrame(kx.XAnchor):
         """Initialize the class."""
         super().__init__()
         self._client = client
-        self._next_dir_refresh: arrow.Arrow = arrow.now()
+        self._next_dir_refresh: float = time.monotonic()
         self.game_dir = dict()
+        self._refresh_pending_since: Optional[float] = None
+        self._shown_game: Optional[tuple[str, Optional[dict]]] = None
         self._make_widgets()
         self.app.controller.bind(f"{self._conpath}.focus", self._focus_list)
         self.app.controller.bind(f"{self._conpath}.focus_create", self._focus_create)
@@ -33,9 +48,10 @@ class LobbyFrame(kx.XAnchor):
             return
         if not self._client.connected:
             return
-        if arrow.now() < self._next_dir_refresh:
+        now = time.monotonic()
+        if now < self._next_dir_refresh:
             return
-        self._next_dir_refresh = arrow.now().shift(seconds=AUTO_REFRESH_INTERVAL)
+        self._next_dir_refresh = now + AUTO_REFRESH_INTERVAL
         self._refresh_games()
 
     def on_parent(self, w, parent):
@@ -137,9 +153,25 @@ class LobbyFrame(kx.XAnchor):
         )
 
     def _refresh_games(self, *args):
-        self._client.get_game_dir(self._on_game_dir_response)
+        now = time.monotonic()
+        if self._refresh_pending_since is not None:
+            if now - self._refresh_pending_since <= REFRESH_TIMEOUT:
+                return
+        self._refresh_pending_since = now
+        self._client.get_game_dir(
+            functools.partial(self._on_game_dir_response, sent=now),
+        )
 
-    def _on_game_dir_response(self, game_dir_response: pgnet.Response):
+    def _on_game_dir_response(
+        self,
+        game_dir_response: pgnet.Response,
+        *,
+        sent: float,
+    ):
+        if sent != self._refresh_pending_since:
+            # Late reply to an expired request, a newer request is pending
+            return
+        self._refresh_pending_since = None
         self.game_dir = game_dir_response.payload.get("games") or dict()
         games = sorted(self.game_dir.keys()) or [""]
         self.games_list.items = games
@@ -151,6 +183,9 @@ class LobbyFrame(kx.XAnchor):
     def _show_game(self, *args, name: str = ""):
         name = self.games_list.items[self.games_list.selection]
         game = self.game_dir.get(name)
+        if (name, game) == self._shown_game:
+            return
+        self._shown_game = name, game
         if not game:
             self.game_info_label.text = "No games found. Create a new game."
             self.join_panel.set_showing("password", False)
@@ -163,13 +198,12 @@ class LobbyFrame(kx.XAnchor):
             ginfo = kx.escape_markup(ginfo)
         else:
             ginfo = "[i]No game information available.[/i]"
-        text = "\n\n".join([
-            f"[b]{name}[/b]",
-            f"{users} users in game.",
-            password,
-            "[u]Game info[/u]",
-            ginfo,
-        ])
+        text = GAME_INFO_TEMPLATE.format(
+            name=name,
+            users=users,
+            password=password,
+            info=ginfo,
+        )
         self.game_info_label.text = text
         self.join_panel.set_showing("password", passprot)
 
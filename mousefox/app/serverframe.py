@@ -7,22 +7,27 @@ import kvex as kx
 import pgnet
 
 
+INFO_WARNING = "Please consider your network security before running a server."
+INFO_TEXT_TEMPLATE = (
+    "[size=20dp][b][u]Hosting a server[/u][/b][/size]"
+    "\n\n"
+    "[b][i]{warning}[/i][/b]"
+    "\n\n"
+    "For best performance, run the server in a separate instance."
+    " You may be required to configure port forwarding on your network device"
+    " before remote clients can discover the server."
+    "\n\n\n"
+    "The running server is available at address"
+    " [font=RobotoMono-Regular]{localhost}[/font] and can"
+    " be connected to normally. To manage a server, connect as admin and use"
+    " the admin panel."
+)
+
+
 def _info_text(subtheme) -> str:
-    warn = "Please consider your network security before running a server."
-    lh = subtheme.fg2.markup("localhost")
-    return (
-        "[size=20dp][b][u]Hosting a server[/u][/b][/size]"
-        "\n\n"
-        f"[b][i]{subtheme.fg2.markup(warn)}[/i][/b]"
-        "\n\n"
-        "For best performance, run the server in a separate instance."
-        " You may be required to configure port forwarding on your network device"
-        " before remote clients can discover the server."
-        "\n\n\n"
-        "The running server is available at address"
-        f" [font=RobotoMono-Regular]{lh}[/font] and can"
-        " be connected to normally. To manage a server, connect as admin and use"
-        " the admin panel."
+    return INFO_TEXT_TEMPLATE.format(
+        warning=subtheme.fg2.markup(INFO_WARNING),
+        localhost=subtheme.fg2.markup("localhost"),
     )
 
 
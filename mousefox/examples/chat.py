@@ -96,6 +96,8 @@ class Game(pgnet.Game):
 
 
 AWAITING_DATA_TEXT = "Awaiting data from server..."
+AUTHOR_COLOR = kx.XColor.from_hex("77ff77")
+OTHER_COLOR = kx.XColor.from_hex("ff7777")
 
 
 class GameWidget(kx.XFrame):
@@ -150,7 +152,7 @@ class GameWidget(kx.XFrame):
             message = Message.deserialize(raw_message)
             time = arrow.get(message.time).to("local").format("HH:mm:ss")
             is_author = message.username == self.client._username
-            color = kx.XColor.from_hex("77ff77" if is_author else "ff7777")
+            color = AUTHOR_COLOR if is_author else OTHER_COLOR
             text_lines.append(color.markup(f"[u]{time} | {message.username}[/u]"))
             text_lines.append(f"{chevron} {message.text}")
         self.messages_label.text = "\n".join(text_lines)
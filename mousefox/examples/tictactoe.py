@@ -1,10 +1,10 @@
 """Example Tic-tac-toe game for MouseFox."""
 
 from typing import Optional
-import arrow
 import copy
 import json
 import random
+import time
 import pgnet
 from pgnet import Packet, Response, Status
 import kvex as kx
@@ -28,6 +28,7 @@ BLANK_DATA = dict(
 )
 BOT_NAME = "Tictactoe Bot"
 BOT_THINK_TIME = 1
+EMPTY_BOARD = ("",) * 9
 
 
 class Game(pgnet.Game):
@@ -37,7 +38,7 @@ class Game(pgnet.Game):
         """Override base method."""
         super().__init__(*args, **kwargs)
         data = json.loads(save_string or json.dumps(BLANK_DATA))
-        self._next_bot_turn = arrow.now()
+        self._next_bot_turn = time.monotonic()
         self.board: list[str] = data["board"]
         self.players: list[str] = data["players"]
         self.x_turn: bool = data["x_turn"]
@@ -138,7 +139,7 @@ class Game(pgnet.Game):
         """Override base method."""
         if self._current_username != BOT_NAME:
             return
-        if arrow.now() <= self._next_bot_turn:
+        if time.monotonic() <= self._next_bot_turn:
             return
         my_mark = self._username_to_mark(BOT_NAME)
         enemy_player_idx = int(not bool(self.players.index(self._current_username)))
@@ -182,7 +183,7 @@ class Game(pgnet.Game):
         if len(self.players) >= 2:
             return Response("Game has already started.", status=Status.UNEXPECTED)
         self.user_joined(BOT_NAME)
-        self._next_bot_turn = arrow.now().shift(seconds=BOT_THINK_TIME)
+        self._next_bot_turn = time.monotonic() + BOT_THINK_TIME
         return Response("Started single player mode.")
 
     def _play_square(self, packet: Packet) -> Response:
@@ -199,7 +200,7 @@ class Game(pgnet.Game):
         self.board[square] = mark
         self.x_turn = not self.x_turn
         self._check_progress()
-        self._next_bot_turn = arrow.now().shift(seconds=BOT_THINK_TIME)
+        self._next_bot_turn = time.monotonic() + BOT_THINK_TIME
 
     def _get_user_info(self, username: str) -> str:
         if not self.in_progress:
@@ -263,16 +264,18 @@ class GameWidget(kx.XFrame):
         # Board
         board_frame = kx.XGrid(cols=3)
         self.board = []
+        self._square_indices = dict()
         for i in range(9):
             square = kx.XButton(
                 font_size=36,
                 background_normal=kx.from_atlas("vkeyboard_key_normal"),
                 background_down=kx.from_atlas("vkeyboard_key_down"),
-                on_release=lambda *a, idx=i: self._play_square(idx),
+                on_release=self._on_square_release,
             )
             square.set_size(hx=0.85, hy=0.85)
             self.board.append(square)
-            board_frame.add_widget(kx.pwrap(square))
+            self._square_indices[square] = i
+        board_frame.add_widgets(*(kx.pwrap(square) for square in self.board))
         # Assemble
         main_frame = kx.XBox()
         main_frame.add_widgets(panel_frame, board_frame)
@@ -302,14 +305,18 @@ class GameWidget(kx.XFrame):
             *(f" {bullet} {s}" for s in spectators),
         ])
         winning_line = state.get("winning_line") or tuple()
-        marks = tuple(str(s or "") for s in state.get("board", [None] * 9))
-        for i, (square_btn, mark) in enumerate(zip(self.board, marks)):
+        board = state.get("board") or EMPTY_BOARD
+        for i, (square_btn, mark) in enumerate(zip(self.board, board)):
+            mark = mark or ""
             square_btn.text = mark
             winning_square = i in winning_line
             square_btn.bold = winning_square
             square_btn.subtheme_name = "accent" if winning_square else "secondary"
         self.single_player_btn.disabled = len(state.get("players", "--")) >= 2
 
+    def _on_square_release(self, square: kx.XButton):
+        self._play_square(self._square_indices[square])
+
     def _play_square(self, index: int, /):
         self.client.send(pgnet.Packet("play_square", dict(square=index)))
 